@@ -1,59 +1,93 @@
 """Inventory management endpoints."""
 
 from datetime import date, timedelta
-from typing import List
+from typing import List, Optional
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, and_
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select, and_, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.utils import construct_from_row, room_type_exists
 from app.database import get_db
 from app.models.inventory import InventoryLedger
-from app.models.property import RoomType
 from app.schemas.inventory import InventoryResponse, BulkInventoryUpdate
+from app.services.sync_engine import _as_date
 
 router = APIRouter()
 
+# Built once so list responses skip per-request schema construction
+_inventory_list = TypeAdapter(List[InventoryResponse])
+
 
 @router.get(
     "/{room_type_id}",
-    response_model=List[InventoryResponse],
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[InventoryResponse]}},
     summary="Get inventory for date range",
 )
 async def get_inventory(
     room_type_id: int,
-    start_date: date = Query(..., description="Start date (inclusive)"),
-    end_date: date = Query(..., description="End date (inclusive)"),
+    start_date: Optional[date] = Query(None, description="Start date (inclusive)"),
+    end_date: Optional[date] = Query(None, description="End date (inclusive)"),
+    dates: Optional[List[date]] = Query(
+        None, description="Specific dates to fetch (instead of a range)"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get inventory availability for a room type within a date range.
     
-    Returns daily availability and pricing information.
+    Pass ``dates`` instead of a range to fetch a non-contiguous set of
+    days in one query. Returns daily availability and pricing information.
     """
+    if dates:
+        # Single bound array parameter (= ANY(...)) on PostgreSQL
+        date_filter = InventoryLedger.date.in_(dates)
+    elif start_date is not None and end_date is not None:
+        date_filter = and_(
+            InventoryLedger.date >= start_date,
+            InventoryLedger.date <= end_date,
+        )
+    else:
+        raise HTTPException(
+            status_code=422,
+            detail="Provide either start_date and end_date, or dates",
+        )
+    
     # Validate room type exists
-    room_result = await db.execute(
-        select(RoomType).where(RoomType.id == room_type_id)
-    )
-    if not room_result.scalar_one_or_none():
+    if not await room_type_exists(db, room_type_id):
         raise HTTPException(status_code=404, detail="Room type not found")
     
-    # Query inventory
+    # Query inventory columns directly (no ORM hydration)
     result = await db.execute(
-        select(InventoryLedger)
+        select(
+            InventoryLedger.id,
+            InventoryLedger.room_type_id,
+            InventoryLedger.date,
+            InventoryLedger.available_rooms,
+            InventoryLedger.base_price,
+            InventoryLedger.version,
+        )
         .where(
             and_(
                 InventoryLedger.room_type_id == room_type_id,
-                InventoryLedger.date >= start_date,
-                InventoryLedger.date <= end_date,
+                date_filter,
             )
         )
         .order_by(InventoryLedger.date)
     )
     
-    inventories = result.scalars().all()
-    return [InventoryResponse.model_validate(inv) for inv in inventories]
+    # Rows come straight from typed columns, so skip re-validation, but
+    # still do the datetime -> date coercion validation would have done
+    inventories = [
+        construct_from_row(InventoryResponse, row, date=_as_date(row["date"]))
+        for row in result.mappings().all()
+    ]
+    return ORJSONResponse(_inventory_list.dump_python(inventories, mode="json"))
 
 
 @router.put(
@@ -72,44 +106,41 @@ async def update_inventory(
     Updates or creates inventory entries for specified dates.
     """
     # Validate room type
-    room_result = await db.execute(
-        select(RoomType).where(RoomType.id == room_type_id)
-    )
-    room_type = room_result.scalar_one_or_none()
-    if not room_type:
+    if not await room_type_exists(db, room_type_id):
         raise HTTPException(status_code=404, detail="Room type not found")
     
-    updated_count = 0
-    created_count = 0
+    # Collapse duplicate dates (last write wins) so the upsert never
+    # touches the same row twice in one statement
+    values = {
+        update.date: {
+            "room_type_id": room_type_id,
+            "date": update.date,
+            "available_rooms": update.available_rooms,
+            "base_price": update.base_price,
+        }
+        for update in updates.updates
+    }
     
-    for update in updates.updates:
-        # Check if entry exists
-        result = await db.execute(
-            select(InventoryLedger).where(
-                and_(
-                    InventoryLedger.room_type_id == room_type_id,
-                    InventoryLedger.date == update.date,
-                )
-            )
-        )
-        inventory = result.scalar_one_or_none()
-        
-        if inventory:
-            inventory.available_rooms = update.available_rooms
-            inventory.base_price = update.base_price
-            inventory.version += 1
-            updated_count += 1
-        else:
-            new_inventory = InventoryLedger(
-                room_type_id=room_type_id,
-                date=update.date,
-                available_rooms=update.available_rooms,
-                base_price=update.base_price,
-            )
-            db.add(new_inventory)
-            created_count += 1
+    if not values:
+        return {"success": True, "updated": 0, "created": 0}
+    
+    # Single INSERT ... ON CONFLICT DO UPDATE for the whole batch; the
+    # conflict target is the unique ix_inventory_room_date index.
+    # xmax = 0 only holds for freshly inserted rows
+    stmt = pg_insert(InventoryLedger).values(list(values.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["room_type_id", "date"],
+        set_={
+            "available_rooms": stmt.excluded.available_rooms,
+            "base_price": stmt.excluded.base_price,
+            "version": InventoryLedger.version + 1,
+        },
+    ).returning(literal_column("xmax = 0").label("inserted"))
     
-    await db.flush()
+    result = await db.execute(stmt)
+    inserted = [row.inserted for row in result]
+    created_count = sum(1 for flag in inserted if flag)
+    updated_count = len(inserted) - created_count
     
     return {
         "success": True,
@@ -139,10 +170,7 @@ async def initialize_inventory(
     from app.services.sync_engine import initialize_inventory as init_inv
     
     # Validate room type
-    room_result = await db.execute(
-        select(RoomType).where(RoomType.id == room_type_id)
-    )
-    if not room_result.scalar_one_or_none():
+    if not await room_type_exists(db, room_type_id):
         raise HTTPException(status_code=404, detail="Room type not found")
     
     await init_inv(
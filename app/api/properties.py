@@ -4,10 +4,13 @@ from typing import List
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 
+from app.api.utils import construct_from_row, property_exists, room_type_exists
 from app.database import get_db
 from app.models.property import Property, RoomType
 from app.models.channel import ChannelMapping
@@ -18,15 +21,34 @@ from app.schemas.property import (
     RoomTypeResponse,
 )
 from app.schemas.channel import ChannelMappingCreate, ChannelMappingResponse
+from app.services import mapping_cache
 from app.services.sync_engine import initialize_inventory
 
 router = APIRouter()
 
+# Built once so list responses skip per-request schema construction
+_property_list = TypeAdapter(List[PropertyResponse])
+_mapping_list = TypeAdapter(List[ChannelMappingResponse])
+
+
+def _property_load_options() -> tuple:
+    """
+    Loader options for property reads.
+    
+    Eager-loads room types and makes any other relationship access raise
+    instead of silently lazy loading (N+1) during serialization.
+    """
+    return (
+        selectinload(Property.room_types).raiseload("*"),
+        raiseload("*"),
+    )
+
 
 @router.post(
     "/",
-    response_model=PropertyResponse,
+    response_model=None,
     status_code=201,
+    responses={201: {"model": PropertyResponse}},
     summary="Create a new property",
 )
 async def create_property(
@@ -36,43 +58,47 @@ async def create_property(
     """
     Create a new hotel property with optional room types.
     """
-    property_obj = Property(
-        name=property_data.name,
-        address=property_data.address,
-        timezone=property_data.timezone,
-    )
-    db.add(property_obj)
-    await db.flush()
+    # Insert with RETURNING so the response is built from the returned
+    # rows: no refresh or reload query, and no re-validation
+    property_row = (
+        await db.execute(
+            insert(Property)
+            .values(
+                name=property_data.name,
+                address=property_data.address,
+                timezone=property_data.timezone,
+            )
+            .returning(*Property.__table__.columns)
+        )
+    ).mappings().one()
     
-    # Add room types if provided
+    room_type_rows = []
     if property_data.room_types:
-        for rt_data in property_data.room_types:
-            room_type = RoomType(
-                property_id=property_obj.id,
-                name=rt_data.name,
-                base_occupancy=rt_data.base_occupancy,
-                max_occupancy=rt_data.max_occupancy,
-                total_rooms=rt_data.total_rooms,
+        room_type_rows = (
+            await db.execute(
+                insert(RoomType)
+                .values([
+                    {"property_id": property_row["id"], **rt_data.model_dump()}
+                    for rt_data in property_data.room_types
+                ])
+                .returning(*RoomType.__table__.columns)
             )
-            db.add(room_type)
-    
-    await db.flush()
-    await db.refresh(property_obj)
+        ).mappings().all()
     
-    # Reload with relationships
-    result = await db.execute(
-        select(Property)
-        .options(selectinload(Property.room_types))
-        .where(Property.id == property_obj.id)
+    response = construct_from_row(
+        PropertyResponse,
+        property_row,
+        room_types=[
+            construct_from_row(RoomTypeResponse, row) for row in room_type_rows
+        ],
     )
-    property_obj = result.scalar_one()
-    
-    return PropertyResponse.model_validate(property_obj)
+    return ORJSONResponse(response.model_dump(mode="json"), status_code=201)
 
 
 @router.get(
     "/",
-    response_model=List[PropertyResponse],
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[PropertyResponse]}},
     summary="List all properties",
 )
 async def list_properties(
@@ -80,10 +106,19 @@ async def list_properties(
 ):
     """Get all properties with their room types."""
     result = await db.execute(
-        select(Property).options(selectinload(Property.room_types))
+        select(Property).options(*_property_load_options())
     )
-    properties = result.scalars().all()
-    return [PropertyResponse.model_validate(p) for p in properties]
+    properties = [
+        construct_from_row(
+            PropertyResponse,
+            p,
+            room_types=[
+                construct_from_row(RoomTypeResponse, rt) for rt in p.room_types
+            ],
+        )
+        for p in result.scalars().all()
+    ]
+    return ORJSONResponse(_property_list.dump_python(properties, mode="json"))
 
 
 @router.get(
@@ -98,7 +133,7 @@ async def get_property(
     """Get a specific property with its room types."""
     result = await db.execute(
         select(Property)
-        .options(selectinload(Property.room_types))
+        .options(*_property_load_options())
         .where(Property.id == property_id)
     )
     property_obj = result.scalar_one_or_none()
@@ -111,8 +146,9 @@ async def get_property(
 
 @router.post(
     "/{property_id}/room-types",
-    response_model=RoomTypeResponse,
+    response_model=None,
     status_code=201,
+    responses={201: {"model": RoomTypeResponse}},
     summary="Add room type to property",
 )
 async def add_room_type(
@@ -128,40 +164,42 @@ async def add_room_type(
     Optionally initialize inventory for 365 days.
     """
     # Verify property exists
-    prop_result = await db.execute(
-        select(Property).where(Property.id == property_id)
-    )
-    if not prop_result.scalar_one_or_none():
+    if not await property_exists(db, property_id):
         raise HTTPException(status_code=404, detail="Property not found")
     
-    room_type = RoomType(
-        property_id=property_id,
-        name=room_type_data.name,
-        base_occupancy=room_type_data.base_occupancy,
-        max_occupancy=room_type_data.max_occupancy,
-        total_rooms=room_type_data.total_rooms,
-    )
-    db.add(room_type)
-    await db.flush()
-    await db.refresh(room_type)
+    room_type_row = (
+        await db.execute(
+            insert(RoomType)
+            .values(
+                property_id=property_id,
+                name=room_type_data.name,
+                base_occupancy=room_type_data.base_occupancy,
+                max_occupancy=room_type_data.max_occupancy,
+                total_rooms=room_type_data.total_rooms,
+            )
+            .returning(*RoomType.__table__.columns)
+        )
+    ).mappings().one()
     
     # Initialize inventory if requested
     if initialize:
         await initialize_inventory(
             db=db,
-            room_type_id=room_type.id,
-            total_rooms=room_type.total_rooms,
+            room_type_id=room_type_row["id"],
+            total_rooms=room_type_row["total_rooms"],
             base_price=default_price,
             days=365,
         )
     
-    return RoomTypeResponse.model_validate(room_type)
+    response = construct_from_row(RoomTypeResponse, room_type_row)
+    return ORJSONResponse(response.model_dump(mode="json"), status_code=201)
 
 
 @router.post(
     "/room-types/{room_type_id}/channel-mapping",
-    response_model=ChannelMappingResponse,
+    response_model=None,
     status_code=201,
+    responses={201: {"model": ChannelMappingResponse}},
     summary="Create channel mapping",
 )
 async def create_channel_mapping(
@@ -175,30 +213,33 @@ async def create_channel_mapping(
     This enables synchronization with the specified OTA channel.
     """
     # Verify room type exists
-    rt_result = await db.execute(
-        select(RoomType).where(RoomType.id == room_type_id)
-    )
-    if not rt_result.scalar_one_or_none():
+    if not await room_type_exists(db, room_type_id):
         raise HTTPException(status_code=404, detail="Room type not found")
     
-    mapping = ChannelMapping(
-        room_type_id=room_type_id,
-        channel_name=mapping_data.channel_name,
-        ota_room_id=mapping_data.ota_room_id,
-        ota_property_id=mapping_data.ota_property_id,
-        is_active=mapping_data.is_active,
-        ical_url=mapping_data.ical_url,
-    )
-    db.add(mapping)
-    await db.flush()
-    await db.refresh(mapping)
+    mapping_row = (
+        await db.execute(
+            insert(ChannelMapping)
+            .values(
+                room_type_id=room_type_id,
+                channel_name=mapping_data.channel_name,
+                ota_room_id=mapping_data.ota_room_id,
+                ota_property_id=mapping_data.ota_property_id,
+                is_active=mapping_data.is_active,
+                ical_url=mapping_data.ical_url,
+            )
+            .returning(*ChannelMapping.__table__.columns)
+        )
+    ).mappings().one()
+    mapping_cache.invalidate(room_type_id)
     
-    return ChannelMappingResponse.model_validate(mapping)
+    response = construct_from_row(ChannelMappingResponse, mapping_row)
+    return ORJSONResponse(response.model_dump(mode="json"), status_code=201)
 
 
 @router.get(
     "/room-types/{room_type_id}/channel-mappings",
-    response_model=List[ChannelMappingResponse],
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[ChannelMappingResponse]}},
     summary="List channel mappings",
 )
 async def list_channel_mappings(
@@ -207,7 +248,12 @@ async def list_channel_mappings(
 ):
     """Get all channel mappings for a room type."""
     result = await db.execute(
-        select(ChannelMapping).where(ChannelMapping.room_type_id == room_type_id)
+        select(ChannelMapping)
+        .options(raiseload("*"))
+        .where(ChannelMapping.room_type_id == room_type_id)
     )
-    mappings = result.scalars().all()
-    return [ChannelMappingResponse.model_validate(m) for m in mappings]
+    mappings = [
+        construct_from_row(ChannelMappingResponse, m)
+        for m in result.scalars().all()
+    ]
+    return ORJSONResponse(_mapping_list.dump_python(mappings, mode="json"))
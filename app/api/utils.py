@@ -0,0 +1,42 @@
+"""Shared query helpers for API endpoints."""
+
+from collections.abc import Mapping
+from typing import Any, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import select, exists
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.property import Property, RoomType
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+async def room_type_exists(db: AsyncSession, room_type_id: int) -> bool:
+    """Check if a room type exists without loading the row."""
+    return bool(
+        await db.scalar(select(exists().where(RoomType.id == room_type_id)))
+    )
+
+
+async def property_exists(db: AsyncSession, property_id: int) -> bool:
+    """Check if a property exists without loading the row."""
+    return bool(
+        await db.scalar(select(exists().where(Property.id == property_id)))
+    )
+
+
+def construct_from_row(model: Type[ModelT], row: Any, **overrides: Any) -> ModelT:
+    """
+    Build a response schema from a trusted DB row without validation.
+    
+    Reads each schema field from ``row`` (ORM object or row mapping);
+    ``overrides`` replaces individual fields such as nested collections.
+    """
+    names = [name for name in model.model_fields if name not in overrides]
+    if isinstance(row, Mapping):
+        values = {name: row[name] for name in names}
+    else:
+        values = {name: getattr(row, name) for name in names}
+    values.update(overrides)
+    return model.model_construct(**values)
@@ -1,25 +1,73 @@
 """Webhook endpoints for OTA booking notifications."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status, BackgroundTasks
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.schemas.booking import BookingWebhookPayload, BookingResult
-from app.services.sync_engine import SyncEngine
-from app.schemas.booking import BookingCreate
+from app.schemas.booking import (
+    BookingCreate,
+    BookingResult,
+    BookingResultList,
+    BookingWebhookPayload,
+    BookingWebhookPayloadList,
+)
+from app.services.sync_engine import SyncEngine, broadcast_booking_availability
 
 router = APIRouter()
 
 
+def _body_validation_error(e: ValidationError) -> RequestValidationError:
+    """Report a raw-body validation failure like FastAPI's own 422s."""
+    return RequestValidationError(
+        [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+    )
+
+
+def _to_booking_create(payload: BookingWebhookPayload) -> BookingCreate:
+    """
+    Convert webhook payload to internal booking create schema.
+    
+    The payload was just validated, so skip a second validation pass.
+    """
+    return BookingCreate.model_construct(
+        room_type_id=payload.room_type_id,
+        channel_name=payload.channel,
+        ota_booking_id=payload.ota_booking_id,
+        check_in=payload.check_in,
+        check_out=payload.check_out,
+        guest_name=payload.guest_name,
+        guest_email=payload.guest_email,
+        num_guests=payload.num_guests,
+    )
+
+
 @router.post(
     "/booking-received",
-    response_model=BookingResult,
+    response_model=None,
+    responses={200: {"model": BookingResult}},
     summary="Receive booking notification from OTA",
     description="Endpoint for OTAs to push new booking notifications. "
                 "Uses distributed locking to prevent overbooking.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": BookingWebhookPayload.model_json_schema(),
+                },
+            },
+        },
+    },
 )
 async def receive_booking(
-    payload: BookingWebhookPayload,
+    request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -29,25 +77,23 @@ async def receive_booking(
     1. Receives booking data from OTA (Booking.com, Airbnb, etc.)
     2. Acquires distributed lock for affected dates
     3. Checks and decrements inventory atomically
-    4. Broadcasts availability update to all channels
+    4. Schedules the availability broadcast to all channels after
+       the response is sent, so OTAs get a fast acknowledgement
     
     Returns success/failure with booking details.
     """
-    # Convert webhook payload to internal booking create schema
-    booking_data = BookingCreate(
-        room_type_id=payload.room_type_id,
-        channel_name=payload.channel,
-        ota_booking_id=payload.ota_booking_id,
-        check_in=payload.check_in,
-        check_out=payload.check_out,
-        guest_name=payload.guest_name,
-        guest_email=payload.guest_email,
-        num_guests=payload.num_guests,
-    )
+    # Validate straight from the raw body in one pass (no intermediate
+    # dict from FastAPI's JSON decoding)
+    try:
+        payload = BookingWebhookPayload.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise _body_validation_error(e)
+    
+    booking_data = _to_booking_create(payload)
     
     # Process booking through sync engine
     sync_engine = SyncEngine(db)
-    result = await sync_engine.process_booking(booking_data)
+    result = await sync_engine.process_booking(booking_data, broadcast=False)
     
     if not result.success:
         raise HTTPException(
@@ -55,7 +101,68 @@ async def receive_booking(
             detail=result.message,
         )
     
-    return result
+    # OTA fan-out runs off the critical path
+    background_tasks.add_task(broadcast_booking_availability, booking_data)
+    
+    return ORJSONResponse(result.model_dump(mode="json"))
+
+
+@router.post(
+    "/bookings-received",
+    response_model=None,
+    responses={200: {"model": List[BookingResult]}},
+    summary="Receive a batch of booking notifications from OTA",
+    description="Batch variant of /booking-received for OTA retry bursts. "
+                "Each booking succeeds or fails independently.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": BookingWebhookPayloadList.json_schema(),
+                },
+            },
+        },
+    },
+)
+async def receive_bookings(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Process a JSON array of OTA bookings.
+    
+    The whole array is validated in one pass; bookings are then processed
+    in order, and a result is returned for each one. Each booking runs in
+    its own SAVEPOINT, so one that the database rejects (e.g. a repeated
+    ota_booking_id) is rolled back alone and reported as failed.
+    """
+    try:
+        payloads = BookingWebhookPayloadList.validate_json(await request.body())
+    except ValidationError as e:
+        raise _body_validation_error(e)
+    
+    sync_engine = SyncEngine(db)
+    results = []
+    for payload in payloads:
+        booking_data = _to_booking_create(payload)
+        try:
+            async with db.begin_nested():
+                result = await sync_engine.process_booking(
+                    booking_data, broadcast=False
+                )
+        except IntegrityError:
+            result = BookingResult(
+                success=False,
+                message=f"Booking {payload.ota_booking_id} could not be recorded "
+                        "(duplicate ota_booking_id or unknown room type)",
+            )
+        if result.success:
+            background_tasks.add_task(broadcast_booking_availability, booking_data)
+        results.append(result)
+    
+    return ORJSONResponse(BookingResultList.dump_python(results, mode="json"))
 
 
 @router.post(
@@ -2,16 +2,23 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import get_settings
 
 settings = get_settings()
 
 # Create async engine
+# Behind pgbouncer (transaction pooling) use poolclass=NullPool instead
 engine = create_async_engine(
     settings.async_database_url,
     echo=settings.debug,
     future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
 )
 
 # Session factory
@@ -4,7 +4,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Date, DateTime, ForeignKey
+from sqlalchemy import Integer, String, Date, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -25,6 +25,7 @@ class Booking(Base):
     """Reservation/booking model."""
     
     __tablename__ = "bookings"
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     room_type_id: Mapped[int] = mapped_column(
@@ -40,11 +41,13 @@ class Booking(Base):
     status: Mapped[str] = mapped_column(
         String(20), default=BookingStatus.CONFIRMED.value, nullable=False
     )
+    # Timestamps are filled in by the database; eager_defaults returns them
+    # via RETURNING so they are available in async code without a reload
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
     
     # Relationships
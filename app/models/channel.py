@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -26,6 +26,7 @@ class ChannelMapping(Base):
     """Maps local room types to external OTA room IDs."""
     
     __tablename__ = "channel_mappings"
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     room_type_id: Mapped[int] = mapped_column(
@@ -36,11 +37,13 @@ class ChannelMapping(Base):
     ota_property_id: Mapped[str] = mapped_column(String(255), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     ical_url: Mapped[str] = mapped_column(String(500), nullable=True)  # For Airbnb
+    # Timestamps are filled in by the database; eager_defaults returns them
+    # via RETURNING so they are available in async code without a reload
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
     
     # Relationships
@@ -4,7 +4,8 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, String, DateTime, ForeignKey, Numeric, Enum as SQLEnum
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Numeric, Index, func
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -20,10 +21,35 @@ class InventoryStatus(str, Enum):
     BLOCKED = "blocked"
 
 
+# Stored as a one-character code ("A"/"R"/"B") instead of a native enum
+_STATUS_TO_CODE = {s: s.value[0].upper() for s in InventoryStatus}
+_CODE_TO_STATUS = {code: s for s, code in _STATUS_TO_CODE.items()}
+
+
+class _StatusComparator(Comparator):
+    """Translate InventoryStatus operands to their stored codes in SQL."""
+
+    def operate(self, op, *other, **kwargs):
+        return op(self.__clause_element__(), *map(self._to_code, other), **kwargs)
+
+    @staticmethod
+    def _to_code(value):
+        if isinstance(value, (list, tuple, set)):
+            # in_() / not_in() pass their operands as one collection
+            return [_STATUS_TO_CODE.get(v, v) for v in value]
+        return _STATUS_TO_CODE.get(value, value)
+
+
 class InventoryLedger(Base):
     """Inventory ledger model for tracking stock levels."""
 
     __tablename__ = "inventory_ledger"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # One ledger row per room type and day; serves every
+        # (room_type_id, date) lookup and the ON CONFLICT upserts
+        Index("ix_inventory_room_date", "room_type_id", "date", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     room_type_id: Mapped[int] = mapped_column(Integer, ForeignKey("room_types.id"), nullable=False)
@@ -31,9 +57,24 @@ class InventoryLedger(Base):
     available_count: Mapped[int] = mapped_column(Integer, default=0)
     reserved_count: Mapped[int] = mapped_column(Integer, default=0)
     blocked_count: Mapped[int] = mapped_column(Integer, default=0)
-    status: Mapped[str] = mapped_column(SQLEnum(InventoryStatus), default=InventoryStatus.AVAILABLE.value)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    status_code: Mapped[str] = mapped_column(
+        "status", String(1), default=_STATUS_TO_CODE[InventoryStatus.AVAILABLE]
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     room_type: Mapped["RoomType"] = relationship("RoomType", back_populates="inventory_ledgers")
+
+    @hybrid_property
+    def status(self) -> InventoryStatus:
+        return _CODE_TO_STATUS[self.status_code]
+
+    @status.inplace.setter
+    def _status_setter(self, value: InventoryStatus) -> None:
+        self.status_code = _STATUS_TO_CODE[InventoryStatus(value)]
+
+    @status.inplace.comparator
+    @classmethod
+    def _status_comparator(cls) -> _StatusComparator:
+        return _StatusComparator(cls.status_code)
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Numeric, Enum as SQLEnum, Text
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Numeric, Enum as SQLEnum, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -26,6 +26,7 @@ class Property(Base):
     """Hotel property model."""
 
     __tablename__ = "properties"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -38,17 +39,22 @@ class Property(Base):
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    room_types: Mapped[list["RoomTypeModel"]] = relationship("RoomTypeModel", back_populates="property")
+    # A property has a handful of room types: always fetch them in one
+    # extra SELECT ... WHERE property_id IN (...) instead of per-row lazy loads
+    room_types: Mapped[list["RoomTypeModel"]] = relationship(
+        "RoomTypeModel", back_populates="property", lazy="selectin"
+    )
 
 
 class RoomTypeModel(Base):
     """Room type configuration for properties."""
 
     __tablename__ = "room_types"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     property_id: Mapped[int] = mapped_column(Integer, ForeignKey("properties.id"), nullable=False)
@@ -58,10 +64,12 @@ class RoomTypeModel(Base):
     total_rooms: Mapped[int] = mapped_column(Integer, default=1)
     base_price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
     amenities: Mapped[str] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
+    # bookings and inventory_ledgers grow without bound (a ledger row per
+    # day), so they stay lazy; opt in with selectinload() where needed
     property: Mapped["Property"] = relationship("Property", back_populates="room_types")
     bookings: Mapped[list["Booking"]] = relationship("Booking", back_populates="room_type")
     inventory_ledgers: Mapped[list["InventoryLedger"]] = relationship("InventoryLedger", back_populates="room_type")
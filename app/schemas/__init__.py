@@ -2,7 +2,14 @@
 
 from app.schemas.property import PropertyCreate, PropertyResponse, RoomTypeCreate, RoomTypeResponse
 from app.schemas.inventory import InventoryUpdate, InventoryResponse, BulkInventoryUpdate
-from app.schemas.booking import BookingCreate, BookingResponse, BookingWebhookPayload
+from app.schemas.booking import (
+    BookingCreate,
+    BookingResponse,
+    BookingResult,
+    BookingResultList,
+    BookingWebhookPayload,
+    BookingWebhookPayloadList,
+)
 from app.schemas.channel import ChannelMappingCreate, ChannelMappingResponse
 
 __all__ = [
@@ -15,7 +22,10 @@ __all__ = [
     "BulkInventoryUpdate",
     "BookingCreate",
     "BookingResponse",
+    "BookingResult",
+    "BookingResultList",
     "BookingWebhookPayload",
+    "BookingWebhookPayloadList",
     "ChannelMappingCreate",
     "ChannelMappingResponse",
 ]
@@ -1,9 +1,9 @@
 """Booking Pydantic schemas."""
 
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class BookingCreate(BaseModel):
@@ -52,3 +52,9 @@ class BookingResult(BaseModel):
     success: bool
     message: str
     booking: Optional[BookingResponse] = None
+
+
+# Built once: validates a whole burst of webhook payloads (a JSON array)
+# in a single pydantic-core call
+BookingWebhookPayloadList = TypeAdapter(List[BookingWebhookPayload])
+BookingResultList = TypeAdapter(List[BookingResult])
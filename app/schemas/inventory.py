@@ -4,7 +4,7 @@ from datetime import date
 from decimal import Decimal
 from typing import List
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class InventoryUpdate(BaseModel):
@@ -30,6 +30,11 @@ class InventoryResponse(BaseModel):
     available_rooms: int
     base_price: Decimal
     version: int
+    
+    @field_serializer("base_price", when_used="json")
+    def serialize_base_price(self, base_price: Decimal) -> float:
+        """Emit prices as JSON numbers; orjson encodes floats natively."""
+        return float(base_price)
 
 
 class InventoryQuery(BaseModel):
@@ -3,16 +3,51 @@
 from abc import ABC, abstractmethod
 from datetime import date
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# (ota_room_id, date, value) entries for the batch push methods
+AvailabilityItem = Tuple[str, date, int]
+RateItem = Tuple[str, date, Decimal]
+
 
 class BaseChannelAdapter(ABC):
-    """Base class for OTA channel adapters."""
+    """
+    Base class for OTA channel adapters.
+    
+    Adapters implement the batch pushes, which send all entries in a
+    single API call; the per-date methods are batches of one.
+    """
     
     @abstractmethod
+    async def push_availability_batch(
+        self,
+        items: List[AvailabilityItem],
+    ) -> bool:
+        """Push availability updates to OTA in one request."""
+        pass
+    
+    @abstractmethod
+    async def push_rate_batch(
+        self,
+        items: List[RateItem],
+    ) -> bool:
+        """Push rate updates to OTA in one request."""
+        pass
+    
+    async def push_availability_bulk(
+        self,
+        ota_room_id: str,
+        items: List[Tuple[date, int]],
+    ) -> bool:
+        """Push availability for many dates of one OTA room in one request."""
+        return await self.push_availability_batch([
+            (ota_room_id, item_date, available_rooms)
+            for item_date, available_rooms in items
+        ])
+    
     async def push_availability(
         self,
         ota_room_id: str,
@@ -20,9 +55,8 @@ class BaseChannelAdapter(ABC):
         available_rooms: int,
     ) -> bool:
         """Push availability update to OTA."""
-        pass
+        return await self.push_availability_batch([(ota_room_id, date, available_rooms)])
     
-    @abstractmethod
     async def push_rate(
         self,
         ota_room_id: str,
@@ -30,100 +64,94 @@ class BaseChannelAdapter(ABC):
         price: Decimal,
     ) -> bool:
         """Push rate update to OTA."""
-        pass
+        return await self.push_rate_batch([(ota_room_id, date, price)])
 
 
 class BookingComAdapter(BaseChannelAdapter):
     """Mock adapter for Booking.com API."""
     
-    async def push_availability(
+    async def push_availability_batch(
         self,
-        ota_room_id: str,
-        date: date,
-        available_rooms: int,
+        items: List[AvailabilityItem],
     ) -> bool:
-        """Push availability to Booking.com (mock)."""
-        logger.info(
-            f"[Booking.com] Pushing availability: room={ota_room_id}, "
-            f"date={date}, available={available_rooms}"
-        )
-        # In production: make API call to Booking.com
+        """Push availability to Booking.com in one request (mock)."""
+        payload = [
+            {"room": ota_room_id, "date": d.isoformat(), "available": available}
+            for ota_room_id, d, available in items
+        ]
+        logger.info(f"[Booking.com] Pushing availability: {payload}")
+        # In production: one bulk API call to Booking.com
         return True
     
-    async def push_rate(
+    async def push_rate_batch(
         self,
-        ota_room_id: str,
-        date: date,
-        price: Decimal,
+        items: List[RateItem],
     ) -> bool:
-        """Push rate to Booking.com (mock)."""
-        logger.info(
-            f"[Booking.com] Pushing rate: room={ota_room_id}, "
-            f"date={date}, price={price}"
-        )
-        # In production: make API call to Booking.com
+        """Push rates to Booking.com in one request (mock)."""
+        payload = [
+            {"room": ota_room_id, "date": d.isoformat(), "price": str(price)}
+            for ota_room_id, d, price in items
+        ]
+        logger.info(f"[Booking.com] Pushing rates: {payload}")
+        # In production: one bulk API call to Booking.com
         return True
 
 
 class AirbnbAdapter(BaseChannelAdapter):
     """Mock adapter for Airbnb API."""
     
-    async def push_availability(
+    async def push_availability_batch(
         self,
-        ota_room_id: str,
-        date: date,
-        available_rooms: int,
+        items: List[AvailabilityItem],
     ) -> bool:
-        """Push availability to Airbnb (mock)."""
-        logger.info(
-            f"[Airbnb] Pushing availability: listing={ota_room_id}, "
-            f"date={date}, available={available_rooms}"
-        )
-        # In production: update Airbnb calendar via API
+        """Push availability to Airbnb in one request (mock)."""
+        payload = [
+            {"listing": ota_room_id, "date": d.isoformat(), "available": available}
+            for ota_room_id, d, available in items
+        ]
+        logger.info(f"[Airbnb] Pushing availability: {payload}")
+        # In production: bulk-update the Airbnb calendar via API
         return True
     
-    async def push_rate(
+    async def push_rate_batch(
         self,
-        ota_room_id: str,
-        date: date,
-        price: Decimal,
+        items: List[RateItem],
     ) -> bool:
-        """Push rate to Airbnb (mock)."""
-        logger.info(
-            f"[Airbnb] Pushing rate: listing={ota_room_id}, "
-            f"date={date}, price={price}"
-        )
-        # In production: update Airbnb pricing via API
+        """Push rates to Airbnb in one request (mock)."""
+        payload = [
+            {"listing": ota_room_id, "date": d.isoformat(), "price": str(price)}
+            for ota_room_id, d, price in items
+        ]
+        logger.info(f"[Airbnb] Pushing rates: {payload}")
+        # In production: bulk-update Airbnb pricing via API
         return True
 
 
 class ExpediaAdapter(BaseChannelAdapter):
     """Mock adapter for Expedia API."""
     
-    async def push_availability(
+    async def push_availability_batch(
         self,
-        ota_room_id: str,
-        date: date,
-        available_rooms: int,
+        items: List[AvailabilityItem],
     ) -> bool:
-        """Push availability to Expedia (mock)."""
-        logger.info(
-            f"[Expedia] Pushing availability: room={ota_room_id}, "
-            f"date={date}, available={available_rooms}"
-        )
+        """Push availability to Expedia in one request (mock)."""
+        payload = [
+            {"room": ota_room_id, "date": d.isoformat(), "available": available}
+            for ota_room_id, d, available in items
+        ]
+        logger.info(f"[Expedia] Pushing availability: {payload}")
         return True
     
-    async def push_rate(
+    async def push_rate_batch(
         self,
-        ota_room_id: str,
-        date: date,
-        price: Decimal,
+        items: List[RateItem],
     ) -> bool:
-        """Push rate to Expedia (mock)."""
-        logger.info(
-            f"[Expedia] Pushing rate: room={ota_room_id}, "
-            f"date={date}, price={price}"
-        )
+        """Push rates to Expedia in one request (mock)."""
+        payload = [
+            {"room": ota_room_id, "date": d.isoformat(), "price": str(price)}
+            for ota_room_id, d, price in items
+        ]
+        logger.info(f"[Expedia] Pushing rates: {payload}")
         return True
 
 
@@ -136,7 +164,12 @@ _adapters: Dict[str, BaseChannelAdapter] = {
 
 
 def get_channel_adapter(channel_name: str) -> Optional[BaseChannelAdapter]:
-    """Get adapter for specified channel."""
+    """
+    Get adapter for specified channel.
+    
+    A single dict lookup, so no memoization is layered on
+    top: register_adapter can replace entries at any time.
+    """
     return _adapters.get(channel_name)
 
 
@@ -1,14 +1,26 @@
 """iCal parser for Airbnb calendar synchronization."""
 
 from dataclasses import dataclass
-from datetime import date, datetime
-from typing import List, Optional
+from datetime import date
+from typing import Iterator, List, Optional
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# RFC 5545 folded lines continue with a leading space or tab
+_FOLD_RE = re.compile(r"\r?\n[ \t]")
+# One VEVENT block, and the properties we read from it (params ignored)
+_EVENT_RE = re.compile(r"BEGIN:VEVENT(?P<body>.*?)END:VEVENT", re.DOTALL)
+# Surrounding blanks and the CR of a CRLF ending stay outside the value
+# group, so matches need no per-field strip()
+_FIELD_RE = re.compile(
+    r"^(DTSTART|DTEND|SUMMARY|UID)(?:;[^:\r\n]*)?:[ \t]*([^\r\n]*?)[ \t]*\r?$",
+    re.MULTILINE,
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class BlockedDateRange:
     """Represents a blocked date range from iCal."""
     start_date: date
@@ -35,59 +47,44 @@ class ICalParser:
         Returns:
             List of BlockedDateRange objects
         """
-        blocked_ranges = []
+        return list(self.iter_ical(ical_content))
+    
+    def iter_ical(self, ical_content: str) -> Iterator[BlockedDateRange]:
+        """
+        Lazily yield blocked date ranges from iCal content.
+        
+        Same parsing as parse_ical without materializing the full list,
+        so large feeds can be consumed in constant memory.
         
+        Args:
+            ical_content: Raw iCal file content
+            
+        Yields:
+            BlockedDateRange objects in feed order
+        """
         try:
-            # Simple parser - in production use icalendar library
-            lines = ical_content.strip().split("\n")
-            current_event = {}
-            in_event = False
+            # Unfold continuation lines, then let the compiled patterns scan
+            # the whole payload instead of dispatching line by line
+            content = _FOLD_RE.sub("", ical_content)
             
-            for line in lines:
-                line = line.strip()
-                
-                if line == "BEGIN:VEVENT":
-                    in_event = True
-                    current_event = {}
-                elif line == "END:VEVENT":
-                    in_event = False
-                    if "DTSTART" in current_event and "DTEND" in current_event:
-                        blocked_ranges.append(
-                            BlockedDateRange(
-                                start_date=current_event["DTSTART"],
-                                end_date=current_event["DTEND"],
-                                summary=current_event.get("SUMMARY"),
-                                uid=current_event.get("UID"),
-                            )
-                        )
-                elif in_event and ":" in line:
-                    key, value = line.split(":", 1)
-                    # Handle date format
-                    if key in ("DTSTART", "DTEND") or key.startswith("DTSTART;") or key.startswith("DTEND;"):
-                        base_key = "DTSTART" if "DTSTART" in key else "DTEND"
-                        current_event[base_key] = self._parse_date(value)
-                    elif key in ("SUMMARY", "UID"):
-                        current_event[key] = value
+            for event in _EVENT_RE.finditer(content):
+                fields = dict(_FIELD_RE.findall(event.group("body")))
+                if "DTSTART" in fields and "DTEND" in fields:
+                    yield BlockedDateRange(
+                        start_date=self._parse_date(fields["DTSTART"]),
+                        end_date=self._parse_date(fields["DTEND"]),
+                        summary=fields.get("SUMMARY"),
+                        uid=fields.get("UID"),
+                    )
             
         except Exception as e:
             logger.error(f"Error parsing iCal: {e}")
-        
-        return blocked_ranges
     
     def _parse_date(self, date_str: str) -> date:
         """Parse iCal date string to date object."""
-        # Remove any value parameters
-        date_str = date_str.strip()
-        
-        # Handle different date formats
-        if "T" in date_str:
-            # DateTime format: 20260115T120000
-            dt = datetime.strptime(date_str[:8], "%Y%m%d")
-        else:
-            # Date only format: 20260115
-            dt = datetime.strptime(date_str[:8], "%Y%m%d")
-        
-        return dt.date()
+        # DATE (20260115) and DATE-TIME (20260115T120000) values share the
+        # YYYYMMDD prefix, so slice it directly instead of using strptime
+        return date(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
     
     def generate_sample_ical(
         self,
@@ -139,7 +136,7 @@ async def sync_airbnb_calendar(
         Sync result with blocked date count
     """
     import httpx
-    from sqlalchemy import select, and_
+    from sqlalchemy import update, and_
     from app.models.inventory import InventoryLedger
     
     try:
@@ -149,37 +146,35 @@ async def sync_airbnb_calendar(
             response.raise_for_status()
             ical_content = response.text
         
-        # Parse blocked dates
+        # Parse blocked dates lazily and update inventory as they stream
+        # in: one ranged UPDATE per block instead of a SELECT per day
         parser = ICalParser()
-        blocked_ranges = parser.parse_ical(ical_content)
-        
-        # Update inventory to reflect blocked dates
+        blocked_ranges = 0
         dates_blocked = 0
-        for block in blocked_ranges:
-            current = block.start_date
-            while current < block.end_date:
-                result = await db_session.execute(
-                    select(InventoryLedger).where(
-                        and_(
-                            InventoryLedger.room_type_id == room_type_id,
-                            InventoryLedger.date == current,
-                        )
+        for block in parser.iter_ical(ical_content):
+            blocked_ranges += 1
+            result = await db_session.execute(
+                update(InventoryLedger)
+                .where(
+                    and_(
+                        InventoryLedger.room_type_id == room_type_id,
+                        InventoryLedger.date >= block.start_date,
+                        InventoryLedger.date < block.end_date,
+                        InventoryLedger.available_rooms > 0,
                     )
                 )
-                inventory = result.scalar_one_or_none()
-                
-                if inventory and inventory.available_rooms > 0:
-                    inventory.available_rooms = 0  # Block the date
-                    inventory.version += 1
-                    dates_blocked += 1
-                
-                current = current + timedelta(days=1)
+                .values(
+                    available_rooms=0,  # Block the dates
+                    version=InventoryLedger.version + 1,
+                )
+            )
+            dates_blocked += result.rowcount
         
         await db_session.flush()
         
         return {
             "success": True,
-            "blocked_ranges": len(blocked_ranges),
+            "blocked_ranges": blocked_ranges,
             "dates_blocked": dates_blocked,
         }
         
@@ -190,6 +185,3 @@ async def sync_airbnb_calendar(
             "error": str(e),
         }
 
-
-# Import needed for sync function
-from datetime import timedelta
@@ -1,6 +1,7 @@
 """Redis-based distributed lock manager for preventing race conditions."""
 
 import asyncio
+import secrets
 from datetime import date
 from typing import Optional
 import redis.asyncio as redis
@@ -9,6 +10,35 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# Take every key with SET NX EX, or none: on the first conflict the keys set
+# so far are deleted server-side. KEYS = lock keys, ARGV[1] = owner token,
+# ARGV[2] = TTL in seconds.
+_ACQUIRE_MULTI_LUA = """
+for i, key in ipairs(KEYS) do
+    if not redis.call('SET', key, ARGV[1], 'NX', 'EX', ARGV[2]) then
+        for j = 1, i - 1 do
+            redis.call('DEL', KEYS[j])
+        end
+        return 0
+    end
+end
+return 1
+"""
+
+# Delete each key only while it still holds our token, so a lock that
+# expired and was taken by another owner is left alone. ARGV[1] = owner
+# token.
+_RELEASE_MULTI_LUA = """
+local released = 0
+for i, key in ipairs(KEYS) do
+    if redis.call('GET', key) == ARGV[1] then
+        redis.call('UNLINK', key)
+        released = released + 1
+    end
+end
+return released
+"""
+
 
 class LockManager:
     """Distributed lock manager using Redis for inventory operations."""
@@ -16,21 +46,33 @@ class LockManager:
     def __init__(self, redis_client: Optional[redis.Redis] = None):
         """Initialize lock manager with optional Redis client."""
         self._redis: Optional[redis.Redis] = redis_client
+        self._pool: Optional[redis.BlockingConnectionPool] = None
         self._lock_prefix = "inventory_lock"
+        # Bound once; formats "<prefix>:<room_type_id>:<iso date>"
+        self._key_tmpl = f"{self._lock_prefix}:{{}}:{{}}".format
+        self._acquire_multi_script = None
+        self._release_multi_script = None
     
     async def get_redis(self) -> redis.Redis:
-        """Get or create Redis connection."""
+        """Get or create Redis client backed by a bounded connection pool."""
         if self._redis is None:
-            self._redis = redis.from_url(
+            # Concurrent lock calls each check out their own connection;
+            # past redis_pool_size they wait up to redis_pool_timeout
+            # seconds for one to free up instead of failing outright
+            self._pool = redis.BlockingConnectionPool.from_url(
                 settings.redis_url,
+                max_connections=settings.redis_pool_size,
+                timeout=settings.redis_pool_timeout,
+                health_check_interval=settings.redis_health_check_interval,
                 encoding="utf-8",
                 decode_responses=True,
             )
+            self._redis = redis.Redis(connection_pool=self._pool)
         return self._redis
     
     def _get_lock_key(self, room_type_id: int, lock_date: date) -> str:
         """Generate unique lock key for room type and date."""
-        return f"{self._lock_prefix}:{room_type_id}:{lock_date.isoformat()}"
+        return self._key_tmpl(room_type_id, lock_date.isoformat())
     
     async def acquire_lock(
         self,
@@ -112,45 +154,109 @@ class LockManager:
         self,
         room_type_id: int,
         dates: list[date],
-    ) -> bool:
+        max_attempts: Optional[int] = None,
+        retry_delay_ms: Optional[int] = None,
+    ) -> Optional[str]:
         """
         Acquire locks for multiple dates atomically.
         If any lock fails, releases all previously acquired locks.
         
+        Each attempt runs as a single Lua script, so the whole acquire (and
+        rollback) costs one round-trip and is atomic on the Redis server.
+        On contention it retries, so concurrent bookings for the same dates
+        wait for the holder instead of being rejected outright.
+        
         Args:
             room_type_id: The room type ID to lock
             dates: List of dates to lock
+            max_attempts: Maximum number of acquisition attempts
+            retry_delay_ms: Delay between retries in milliseconds
             
         Returns:
-            True if all locks were acquired, False otherwise
+            The owner token to pass to release_multi_date_lock if all locks
+            were acquired, None after all retries failed
         """
-        acquired_dates: list[date] = []
+        token = secrets.token_hex(16)
+        if not dates:
+            return token
         
-        for lock_date in sorted(dates):
-            if await self.acquire_lock(room_type_id, lock_date):
-                acquired_dates.append(lock_date)
-            else:
-                # Rollback: release all acquired locks
-                for acquired in acquired_dates:
-                    await self.release_lock(room_type_id, acquired)
-                return False
-        
-        return True
+        await self._register_scripts()
+        
+        key_tmpl = self._key_tmpl
+        keys = [key_tmpl(room_type_id, d.isoformat()) for d in sorted(dates)]
+        attempts = max_attempts or settings.lock_retry_attempts
+        delay = (retry_delay_ms or settings.lock_retry_delay_ms) / 1000.0
+        
+        for attempt in range(attempts):
+            if await self._acquire_multi_script(
+                keys=keys,
+                args=[token, settings.lock_ttl_seconds],
+            ):
+                return token
+            if attempt < attempts - 1:
+                await asyncio.sleep(delay)
+        
+        return None
     
     async def release_multi_date_lock(
         self,
         room_type_id: int,
         dates: list[date],
+        token: str,
     ) -> None:
-        """Release locks for multiple dates."""
-        for lock_date in dates:
-            await self.release_lock(room_type_id, lock_date)
+        """
+        Release locks for multiple dates in one round-trip.
+        
+        Only keys still holding the given owner token are deleted, so a
+        late release after the locks expired and changed hands is a no-op.
+        
+        Args:
+            room_type_id: The room type ID
+            dates: Dates locked by acquire_multi_date_lock
+            token: Owner token returned by acquire_multi_date_lock
+        """
+        if not dates:
+            return
+        
+        await self._register_scripts()
+        key_tmpl = self._key_tmpl
+        keys = [key_tmpl(room_type_id, d.isoformat()) for d in dates]
+        # UNLINK frees the keys asynchronously on the server
+        await self._release_multi_script(keys=keys, args=[token])
+    
+    async def _register_scripts(self) -> None:
+        """Register the multi-date Lua scripts on first use."""
+        if self._acquire_multi_script is None:
+            redis_client = await self.get_redis()
+            self._acquire_multi_script = redis_client.register_script(
+                _ACQUIRE_MULTI_LUA
+            )
+            self._release_multi_script = redis_client.register_script(
+                _RELEASE_MULTI_LUA
+            )
+    
+    async def load_scripts(self) -> None:
+        """
+        Load the Lua scripts into the Redis script cache ahead of time.
+        
+        The first acquire/release then runs straight off EVALSHA instead of
+        taking a NOSCRIPT error and resending the script body.
+        """
+        await self._register_scripts()
+        redis_client = await self.get_redis()
+        for script in (self._acquire_multi_script, self._release_multi_script):
+            await redis_client.script_load(script.script)
     
     async def close(self) -> None:
-        """Close Redis connection."""
+        """Close Redis connection and its pool."""
         if self._redis:
             await self._redis.close()
             self._redis = None
+            self._acquire_multi_script = None
+            self._release_multi_script = None
+        if self._pool is not None:
+            await self._pool.disconnect()
+            self._pool = None
 
 
 # Global lock manager instance
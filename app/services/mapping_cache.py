@@ -0,0 +1,63 @@
+"""Per-process TTL cache of active channel mappings."""
+
+import time
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.channel import ChannelMapping
+
+settings = get_settings()
+
+# room_type_id -> (expires_at, [(channel_name, ota_room_id), ...])
+_cache: Dict[int, Tuple[float, List[Tuple[str, str]]]] = {}
+# Bumped by invalidate() so a lookup that started before a mapping write
+# does not store its (stale) result afterwards
+_generations: Dict[int, int] = {}
+
+
+async def get_active_mappings(
+    db: AsyncSession,
+    room_type_id: int,
+) -> List[Tuple[str, str]]:
+    """
+    Get (channel_name, ota_room_id) pairs of active mappings for a room type.
+    
+    Served from the cache while fresh; otherwise loaded with one SELECT
+    and cached for settings.mapping_cache_ttl_seconds.
+    """
+    entry = _cache.get(room_type_id)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    
+    generation = _generations.get(room_type_id, 0)
+    result = await db.execute(
+        select(ChannelMapping.channel_name, ChannelMapping.ota_room_id).where(
+            and_(
+                ChannelMapping.room_type_id == room_type_id,
+                ChannelMapping.is_active == True,
+            )
+        )
+    )
+    mappings = [tuple(row) for row in result.all()]
+    
+    if _generations.get(room_type_id, 0) == generation:
+        _cache[room_type_id] = (
+            time.monotonic() + settings.mapping_cache_ttl_seconds,
+            mappings,
+        )
+    return mappings
+
+
+def invalidate(room_type_id: int) -> None:
+    """Drop cached mappings for a room type after a mapping write."""
+    _generations[room_type_id] = _generations.get(room_type_id, 0) + 1
+    _cache.pop(room_type_id, None)
+
+
+def clear() -> None:
+    """Drop all cached mappings."""
+    _cache.clear()
+    _generations.clear()
@@ -1,19 +1,106 @@
 """Sync engine for managing inventory updates and OTA synchronization."""
 
 import asyncio
-from datetime import date, timedelta
+import functools
+import logging
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select, and_
+from sqlalchemy import bindparam, insert, select, update, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import async_session_factory
 from app.models.inventory import InventoryLedger
 from app.models.booking import Booking, BookingStatus
-from app.models.channel import ChannelMapping
 from app.schemas.booking import BookingCreate, BookingResponse, BookingResult
 from app.services.lock_manager import LockManager, get_lock_manager
-from app.services.channel_adapter import get_channel_adapter
+from app.services.channel_adapter import BaseChannelAdapter, get_channel_adapter
+from app.services.mapping_cache import get_active_mappings
+
+logger = logging.getLogger(__name__)
+
+
+# Hot-path statements are built once and reused with bound parameters, so
+# each call skips statement construction and hits the same compiled-SQL
+# cache entry. Built on first use rather than at import time, which would
+# force mapper configuration while the models are still being imported.
+# Bind names must not collide with column names (reserved in UPDATE SET).
+@functools.cache
+def _decrement_stmt():
+    """Guarded UPDATE taking one room for each of :dates, returning the dates hit."""
+    return (
+        update(InventoryLedger)
+        .where(
+            and_(
+                InventoryLedger.room_type_id == bindparam("b_room_type_id"),
+                InventoryLedger.date.in_(bindparam("dates", expanding=True)),
+                InventoryLedger.available_rooms >= 1,
+            )
+        )
+        .values(
+            available_rooms=InventoryLedger.available_rooms - 1,
+            version=InventoryLedger.version + 1,
+        )
+        .returning(InventoryLedger.date)
+    )
+
+
+@functools.cache
+def _inventory_for_dates_stmt():
+    """SELECT (date, available_rooms) for :b_room_type_id and :dates."""
+    return select(InventoryLedger.date, InventoryLedger.available_rooms).where(
+        and_(
+            InventoryLedger.room_type_id == bindparam("b_room_type_id"),
+            InventoryLedger.date.in_(bindparam("dates", expanding=True)),
+        )
+    )
+
+
+@functools.cache
+def _rate_update_stmt():
+    """UPDATE base_price to :new_price for :b_room_type_id on :target_date."""
+    return (
+        update(InventoryLedger)
+        .where(
+            and_(
+                InventoryLedger.room_type_id == bindparam("b_room_type_id"),
+                InventoryLedger.date == bindparam("target_date"),
+            )
+        )
+        .values(
+            base_price=bindparam("new_price"),
+            version=InventoryLedger.version + 1,
+        )
+        .returning(InventoryLedger.version)
+    )
+
+
+def _resolve_adapters(
+    mappings: List[Tuple[str, str]],
+) -> List[Tuple[str, str, BaseChannelAdapter]]:
+    """
+    Pair each (channel_name, ota_room_id) mapping with its adapter.
+    
+    Resolves every channel once up front; mappings for channels without a
+    registered adapter are dropped.
+    """
+    resolved = []
+    for channel_name, ota_room_id in mappings:
+        adapter = get_channel_adapter(channel_name)
+        if adapter is not None:
+            resolved.append((channel_name, ota_room_id, adapter))
+    return resolved
+
+
+def _as_date(value) -> date:
+    """Normalize a ledger date (DATE or TIMESTAMP column) to a date."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+class _PartialDecrement(Exception):
+    """Raised inside the decrement savepoint to roll it back."""
 
 
 class SyncEngine:
@@ -38,19 +125,22 @@ class SyncEngine:
     async def process_booking(
         self,
         booking_data: BookingCreate,
+        broadcast: bool = True,
     ) -> BookingResult:
         """
         Process an incoming booking with atomic inventory update.
         
         This method:
         1. Acquires distributed locks for all affected dates
-        2. Checks availability for each night
-        3. Decrements inventory atomically
-        4. Creates booking record
-        5. Triggers availability broadcast
+        2. Decrements inventory atomically, failing if any night is full
+        3. Creates booking record
+        4. Triggers availability broadcast
         
         Args:
             booking_data: Booking details from OTA
+            broadcast: Fire the availability broadcast from here; pass
+                False when the caller schedules it itself (see
+                broadcast_booking_availability)
             
         Returns:
             BookingResult with success status and booking details
@@ -67,121 +157,114 @@ class SyncEngine:
                 message="Invalid date range: check-out must be after check-in",
             )
         
-        # Try to acquire locks for all dates
-        locks_acquired = await self.lock_manager.acquire_multi_date_lock(
+        # Try to acquire locks for all dates; the token proves ownership
+        # when releasing them
+        lock_token = await self.lock_manager.acquire_multi_date_lock(
             booking_data.room_type_id,
             booking_dates,
         )
         
-        if not locks_acquired:
+        if lock_token is None:
             return BookingResult(
                 success=False,
                 message="Unable to acquire inventory lock. Please retry.",
             )
         
+        # Only the inventory decrement needs the Redis lock. Once
+        # the guarded UPDATE has run, its row locks (and the version bump)
+        # protect the rows for the rest of the transaction, and the booking
+        # row is kept unique by ota_booking_id, so the lock is released
+        # before the insert and broadcast.
         try:
-            # Check availability for all dates
-            availability_check = await self._check_availability(
+            # The guarded UPDATE is the availability check: it only touches
+            # nights that still have a room, and any night it misses is
+            # unavailable
+            unavailable_dates = await self._decrement_inventory(
                 booking_data.room_type_id,
                 booking_dates,
             )
             
-            if not availability_check["available"]:
+            if unavailable_dates:
                 return BookingResult(
                     success=False,
-                    message=f"No availability for dates: {availability_check['unavailable_dates']}",
+                    message=f"No availability for dates: {unavailable_dates}",
                 )
             
-            # Decrement inventory for all dates
-            await self._decrement_inventory(
+        finally:
+            # Always release locks
+            await self.lock_manager.release_multi_date_lock(
                 booking_data.room_type_id,
                 booking_dates,
+                lock_token,
             )
-            
-            # Create booking record
-            booking = Booking(
-                room_type_id=booking_data.room_type_id,
-                channel_name=booking_data.channel_name,
-                ota_booking_id=booking_data.ota_booking_id,
-                check_in=booking_data.check_in,
-                check_out=booking_data.check_out,
-                guest_name=booking_data.guest_name,
-                guest_email=booking_data.guest_email,
-                num_guests=booking_data.num_guests,
-                status=BookingStatus.CONFIRMED.value,
+        
+        # Create booking record; RETURNING hands back the id and
+        # server-side timestamps without a follow-up SELECT
+        booking = (
+            await self.db.execute(
+                insert(Booking)
+                .values(
+                    room_type_id=booking_data.room_type_id,
+                    channel_name=booking_data.channel_name,
+                    ota_booking_id=booking_data.ota_booking_id,
+                    check_in=booking_data.check_in,
+                    check_out=booking_data.check_out,
+                    guest_name=booking_data.guest_name,
+                    guest_email=booking_data.guest_email,
+                    num_guests=booking_data.num_guests,
+                    status=BookingStatus.CONFIRMED.value,
+                )
+                .returning(*Booking.__table__.columns)
             )
-            self.db.add(booking)
-            await self.db.flush()
-            await self.db.refresh(booking)
-            
-            # Trigger async availability broadcast (fire and forget)
+        ).mappings().one()
+        
+        # Trigger async availability broadcast (fire and forget)
+        if broadcast:
             asyncio.create_task(
                 self.broadcast_availability(
                     booking_data.room_type_id,
                     booking_dates,
                 )
             )
-            
-            return BookingResult(
-                success=True,
-                message="Booking confirmed successfully",
-                booking=BookingResponse.model_validate(booking),
-            )
-            
-        finally:
-            # Always release locks
-            await self.lock_manager.release_multi_date_lock(
-                booking_data.room_type_id,
-                booking_dates,
-            )
-    
-    async def _check_availability(
-        self,
-        room_type_id: int,
-        dates: List[date],
-    ) -> dict:
-        """Check if rooms are available for all specified dates."""
-        unavailable_dates = []
-        
-        for check_date in dates:
-            result = await self.db.execute(
-                select(InventoryLedger).where(
-                    and_(
-                        InventoryLedger.room_type_id == room_type_id,
-                        InventoryLedger.date == check_date,
-                    )
-                )
-            )
-            inventory = result.scalar_one_or_none()
-            
-            if inventory is None or inventory.available_rooms < 1:
-                unavailable_dates.append(check_date.isoformat())
         
-        return {
-            "available": len(unavailable_dates) == 0,
-            "unavailable_dates": unavailable_dates,
-        }
+        return BookingResult(
+            success=True,
+            message="Booking confirmed successfully",
+            booking=BookingResponse.model_validate(dict(booking)),
+        )
     
     async def _decrement_inventory(
         self,
         room_type_id: int,
         dates: List[date],
-    ) -> None:
-        """Decrement available rooms for specified dates."""
-        for decr_date in dates:
-            result = await self.db.execute(
-                select(InventoryLedger).where(
-                    and_(
-                        InventoryLedger.room_type_id == room_type_id,
-                        InventoryLedger.date == decr_date,
-                    )
+    ) -> List[str]:
+        """
+        Take one room for each of the specified dates in one UPDATE.
+        
+        The available_rooms >= 1 predicate makes the statement its own
+        availability check, so there is no separate SELECT to race
+        against. If any night no longer has a room, the UPDATE is rolled
+        back to a savepoint and no night is decremented.
+        
+        Returns:
+            ISO dates that had no room (empty if every date was decremented)
+        """
+        unavailable_dates: List[str] = []
+        try:
+            async with self.db.begin_nested():
+                result = await self.db.execute(
+                    _decrement_stmt(),
+                    {"b_room_type_id": room_type_id, "dates": dates},
                 )
-            )
-            inventory = result.scalar_one_or_none()
-            
-            if inventory and inventory.available_rooms >= 1:
-                inventory.available_rooms -= 1
-                inventory.version += 1
+                decremented = {_as_date(d) for d in result.scalars()}
+                unavailable_dates = [
+                    d.isoformat() for d in dates if d not in decremented
+                ]
+                if unavailable_dates:
+                    raise _PartialDecrement()
+        except _PartialDecrement:
+            pass
+        return unavailable_dates
     
     async def broadcast_availability(
         self,
@@ -194,37 +277,39 @@ class SyncEngine:
         This is typically called asynchronously after inventory changes.
         """
         # Get all active channel mappings for this room type
-        result = await self.db.execute(
-            select(ChannelMapping).where(
-                and_(
-                    ChannelMapping.room_type_id == room_type_id,
-                    ChannelMapping.is_active == True,
-                )
-            )
-        )
-        mappings = result.scalars().all()
+        mappings = await get_active_mappings(self.db, room_type_id)
         
         # Get current inventory for affected dates
         inventory_result = await self.db.execute(
-            select(InventoryLedger).where(
-                and_(
-                    InventoryLedger.room_type_id == room_type_id,
-                    InventoryLedger.date.in_(dates),
-                )
-            )
+            _inventory_for_dates_stmt(),
+            {"b_room_type_id": room_type_id, "dates": dates},
         )
-        inventories = {inv.date: inv for inv in inventory_result.scalars().all()}
+        # Plain (date, rooms) pairs, built once and shared by every channel;
+        # no ORM objects or instrumented attribute reads per push
+        availability = [
+            (_as_date(d), rooms) for d, rooms in inventory_result.tuples()
+        ]
         
-        # Push to each channel
-        for mapping in mappings:
-            adapter = get_channel_adapter(mapping.channel_name)
-            if adapter:
-                for inv_date, inventory in inventories.items():
-                    await adapter.push_availability(
-                        ota_room_id=mapping.ota_room_id,
-                        date=inv_date,
-                        available_rooms=inventory.available_rooms,
-                    )
+        if not availability:
+            return
+        
+        # Push to all channels concurrently, one batched call per channel
+        pushes = []
+        for channel_name, ota_room_id, adapter in _resolve_adapters(mappings):
+            pushes.append((
+                channel_name,
+                adapter.push_availability_bulk(ota_room_id, availability),
+            ))
+        
+        results = await asyncio.gather(
+            *(push for _, push in pushes),
+            return_exceptions=True,
+        )
+        for (channel_name, _), result in zip(pushes, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Availability push to {channel_name} failed: {result}"
+                )
     
     async def update_rate_parity(
         self,
@@ -245,73 +330,74 @@ class SyncEngine:
         Returns:
             Dict with update results per channel
         """
-        # Update local inventory price
+        # Update local inventory price in a single atomic statement
         result = await self.db.execute(
-            select(InventoryLedger).where(
-                and_(
-                    InventoryLedger.room_type_id == room_type_id,
-                    InventoryLedger.date == target_date,
-                )
-            )
+            _rate_update_stmt(),
+            {
+                "b_room_type_id": room_type_id,
+                "target_date": target_date,
+                "new_price": new_price,
+            },
         )
-        inventory = result.scalar_one_or_none()
-        
-        if inventory:
-            inventory.base_price = new_price
-            inventory.version += 1
+        updated = result.one_or_none()
         
         # Get all active channel mappings
-        mapping_result = await self.db.execute(
-            select(ChannelMapping).where(
-                and_(
-                    ChannelMapping.room_type_id == room_type_id,
-                    ChannelMapping.is_active == True,
-                )
-            )
-        )
-        mappings = mapping_result.scalars().all()
+        mappings = await get_active_mappings(self.db, room_type_id)
         
         # Push to all channels concurrently
-        results = {}
-        tasks = []
-        
-        for mapping in mappings:
-            adapter = get_channel_adapter(mapping.channel_name)
-            if adapter:
-                task = adapter.push_rate(
-                    ota_room_id=mapping.ota_room_id,
+        pushes = []
+        for channel_name, ota_room_id, adapter in _resolve_adapters(mappings):
+            pushes.append((
+                channel_name,
+                adapter.push_rate(
+                    ota_room_id=ota_room_id,
                     date=target_date,
                     price=new_price,
-                )
-                tasks.append((mapping.channel_name, task))
+                ),
+            ))
         
-        # Execute all rate pushes concurrently
-        for channel_name, task in tasks:
-            try:
-                success = await task
-                results[channel_name] = {"success": success}
-            except Exception as e:
-                results[channel_name] = {"success": False, "error": str(e)}
+        outcomes = await asyncio.gather(
+            *(push for _, push in pushes),
+            return_exceptions=True,
+        )
+        results = {}
+        for (channel_name, _), outcome in zip(pushes, outcomes):
+            if isinstance(outcome, Exception):
+                results[channel_name] = {"success": False, "error": str(outcome)}
+            else:
+                results[channel_name] = {"success": outcome}
         
         return {
             "room_type_id": room_type_id,
             "date": target_date.isoformat(),
             "new_price": str(new_price),
+            "version": updated.version if updated else None,
             "channel_updates": results,
         }
     
-    def _get_date_range(self, check_in: date, check_out: date) -> List[date]:
+    @staticmethod
+    def _get_date_range(check_in: date, check_out: date) -> List[date]:
         """Get list of dates from check-in to check-out (exclusive of check-out)."""
-        if check_out <= check_in:
-            return []
-        
-        dates = []
-        current = check_in
-        while current < check_out:
-            dates.append(current)
-            current += timedelta(days=1)
-        
-        return dates
+        nights = (check_out - check_in).days
+        return [check_in + timedelta(days=i) for i in range(nights)]
+
+
+async def broadcast_booking_availability(booking_data: BookingCreate) -> None:
+    """
+    Broadcast availability for a processed booking in its own session.
+    
+    Intended to run after the webhook response has been sent (e.g. via
+    FastAPI BackgroundTasks), when the request session is already closed.
+    """
+    async with async_session_factory() as session:
+        sync_engine = SyncEngine(session)
+        await sync_engine.broadcast_availability(
+            booking_data.room_type_id,
+            sync_engine._get_date_range(
+                booking_data.check_in,
+                booking_data.check_out,
+            ),
+        )
 
 
 async def initialize_inventory(
@@ -331,31 +417,50 @@ async def initialize_inventory(
         base_price: Default price per night
         days: Number of days to initialize (default 365)
     """
-    from datetime import date as date_type
+    # Walk the days as ordinals; integer steps avoid a timedelta per row
+    first_day = date.today().toordinal()
+    target_dates = [
+        date.fromordinal(day) for day in range(first_day, first_day + days)
+    ]
     
-    today = date_type.today()
+    if not target_dates:
+        return
     
-    for day_offset in range(days):
-        inv_date = today + timedelta(days=day_offset)
-        
-        # Check if entry already exists
-        result = await db.execute(
-            select(InventoryLedger).where(
+    # One IN query finds the dates that are already seeded; they are left
+    # untouched. The column is a DateTime, so compare as dates.
+    existing_dates = {
+        _as_date(d)
+        for d in await db.scalars(
+            select(InventoryLedger.date).where(
                 and_(
                     InventoryLedger.room_type_id == room_type_id,
-                    InventoryLedger.date == inv_date,
+                    InventoryLedger.date.in_(target_dates),
                 )
             )
         )
-        existing = result.scalar_one_or_none()
-        
-        if not existing:
-            inventory = InventoryLedger(
-                room_type_id=room_type_id,
-                date=inv_date,
-                available_rooms=total_rooms,
-                base_price=base_price,
-            )
-            db.add(inventory)
+    }
+    rows = [
+        {
+            "room_type_id": room_type_id,
+            "date": d,
+            "available_rooms": total_rooms,
+            "base_price": base_price,
+        }
+        for d in target_dates
+        if d not in existing_dates
+    ]
     
-    await db.flush()
+    if not rows:
+        return
+    
+    connection = await db.connection()
+    if connection.dialect.name == "postgresql":
+        # One multi-row INSERT; ON CONFLICT still skips dates a concurrent
+        # initializer seeded after the lookup above
+        await db.execute(
+            pg_insert(InventoryLedger).values(rows).on_conflict_do_nothing(
+                index_elements=["room_type_id", "date"],
+            )
+        )
+    else:
+        await db.execute(insert(InventoryLedger), rows)
@@ -5,22 +5,51 @@ from datetime import date, timedelta
 from decimal import Decimal
 from typing import AsyncGenerator, Generator
 
+import fakeredis.aioredis
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import selectinload
 from sqlalchemy.pool import StaticPool
 import redis.asyncio as redis
 
 from app.database import Base, get_db
 from app.models import Property, RoomType, InventoryLedger, ChannelMapping
+from app.services import mapping_cache
 from app.services.lock_manager import LockManager
+from app.services.sync_engine import SyncEngine
 from app.main import app
 
 
-# Use in-memory SQLite for tests
+# Use in-memory SQLite for tests. Under pytest-xdist each worker is its
+# own process with its own in-memory database and fake Redis.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+def _enable_sqlite_savepoints(engine: AsyncEngine) -> None:
+    """
+    Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work on SQLite.
+    
+    The booking paths under test use begin_nested(), which the driver's
+    own transaction handling would break.
+    """
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        # AUTOCOMMIT connections (readonly_session) run without a transaction
+        if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+            conn.exec_driver_sql("BEGIN")
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
     """Create event loop for async tests."""
@@ -37,6 +66,7 @@ async def async_engine():
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
     )
+    _enable_sqlite_savepoints(engine)
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -49,6 +79,14 @@ async def async_engine():
     await engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def clear_mapping_cache():
+    """Keep cached channel mappings from leaking between test databases."""
+    mapping_cache.clear()
+    yield
+    mapping_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
     """Create database session for tests."""
@@ -62,14 +100,59 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest_asyncio.fixture(scope="function")
+async def race_engine(tmp_path) -> AsyncGenerator[AsyncEngine, None]:
+    """
+    File-backed engine for tests that book from concurrent tasks.
+    
+    Each pooled connection is its own SQLite connection, so concurrent
+    sessions never share one (the in-memory engine has a single connection).
+    Writes are committed for real; the file goes away with tmp_path.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'race.db'}")
+    _enable_sqlite_savepoints(engine)
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    yield engine
+    
+    await engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory(race_engine) -> async_sessionmaker[AsyncSession]:
+    """Session factory for concurrent tasks, one session (and connection) per task."""
+    return async_sessionmaker(race_engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def readonly_session(
+    async_session_factory,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for post-booking verification reads of committed rows.
+    
+    Pinned to AUTOCOMMIT, so the reads run without BEGIN/COMMIT.
+    """
+    async with async_session_factory() as session:
+        await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        yield session
+
+
+@pytest_asyncio.fixture(scope="function")
+async def race_room_type_id(async_session_factory) -> int:
+    """Commit a sample property with room type to the race database."""
+    async with async_session_factory() as session:
+        room_type = await _add_sample_property(session)
+        await session.commit()
+        return room_type.id
+
+
 @pytest_asyncio.fixture(scope="function")
 async def redis_client() -> AsyncGenerator[redis.Redis, None]:
-    """Create Redis client for tests."""
-    client = redis.from_url(
-        "redis://localhost:6379/15",  # Use separate DB for tests
-        encoding="utf-8",
-        decode_responses=True,
-    )
+    """Create in-process fake Redis client for tests (Lua via lupa)."""
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
     
     # Clear test database
     await client.flushdb()
@@ -88,16 +171,21 @@ async def lock_manager(redis_client) -> LockManager:
     yield manager
 
 
-@pytest_asyncio.fixture(scope="function")
-async def sample_property(db_session: AsyncSession) -> Property:
-    """Create a sample property with room type."""
+@pytest.fixture
+def sync_engine(db_session, lock_manager) -> SyncEngine:
+    """Create one sync engine per test, shared by its booking calls."""
+    return SyncEngine(db_session, lock_manager)
+
+
+async def _add_sample_property(session: AsyncSession) -> RoomType:
+    """Add a property with one room type and channel mapping; returns the room type."""
     prop = Property(
         name="Test Hotel",
         address="123 Test Street",
         timezone="UTC",
     )
-    db_session.add(prop)
-    await db_session.flush()
+    session.add(prop)
+    await session.flush()
     
     room_type = RoomType(
         property_id=prop.id,
@@ -106,8 +194,8 @@ async def sample_property(db_session: AsyncSession) -> Property:
         max_occupancy=4,
         total_rooms=5,
     )
-    db_session.add(room_type)
-    await db_session.flush()
+    session.add(room_type)
+    await session.flush()
     
     # Add channel mapping
     mapping = ChannelMapping(
@@ -116,53 +204,55 @@ async def sample_property(db_session: AsyncSession) -> Property:
         ota_room_id="BCH123456",
         is_active=True,
     )
-    db_session.add(mapping)
-    await db_session.flush()
+    session.add(mapping)
+    await session.flush()
     
-    await db_session.refresh(prop)
-    return prop
+    return room_type
 
 
 @pytest_asyncio.fixture(scope="function")
-async def sample_inventory(
-    db_session: AsyncSession,
-    sample_property: Property,
-) -> list[InventoryLedger]:
-    """Create sample inventory for next 7 days."""
-    room_type = sample_property.room_types[0]
-    inventories = []
-    
-    today = date.today()
-    for i in range(7):
-        inv = InventoryLedger(
-            room_type_id=room_type.id,
-            date=today + timedelta(days=i),
-            available_rooms=5,
-            base_price=Decimal("100.00"),
-        )
-        db_session.add(inv)
-        inventories.append(inv)
+async def sample_property(db_session: AsyncSession) -> Property:
+    """Create a sample property with room type."""
+    room_type = await _add_sample_property(db_session)
     
-    await db_session.flush()
-    return inventories
+    # Reload with room types eagerly fetched so fixtures and tests can
+    # read sample_property.room_types without an implicit lazy load
+    result = await db_session.execute(
+        select(Property)
+        .options(selectinload(Property.room_types))
+        .where(Property.id == room_type.property_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def last_room_inventory(
+async def sample_inventory(
     db_session: AsyncSession,
     sample_property: Property,
-) -> InventoryLedger:
-    """Create inventory with only 1 room available (for race condition test)."""
+) -> list[InventoryLedger]:
+    """Create sample inventory for next 7 days."""
     room_type = sample_property.room_types[0]
     
     today = date.today()
-    inv = InventoryLedger(
-        room_type_id=room_type.id,
-        date=today + timedelta(days=1),  # Tomorrow
-        available_rooms=1,  # Only 1 room!
-        base_price=Decimal("150.00"),
+    # One executemany INSERT instead of seven unit-of-work inserts
+    await db_session.execute(
+        insert(InventoryLedger),
+        [
+            {
+                "room_type_id": room_type.id,
+                "date": today + timedelta(days=i),
+                "available_rooms": 5,
+                "base_price": Decimal("100.00"),
+            }
+            for i in range(7)
+        ],
     )
-    db_session.add(inv)
-    await db_session.flush()
     
-    return inv
+    result = await db_session.execute(
+        select(InventoryLedger)
+        .where(InventoryLedger.room_type_id == room_type.id)
+        .order_by(InventoryLedger.date)
+    )
+    return list(result.scalars().all())
+
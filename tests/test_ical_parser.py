@@ -0,0 +1,48 @@
+"""Tests for the iCal parser."""
+
+from datetime import date
+
+from app.services.ical_parser import BlockedDateRange, ICalParser
+
+
+def test_parse_round_trips_generated_calendar():
+    """Test that generated sample calendars parse back to the same ranges."""
+    parser = ICalParser()
+    blocks = [
+        BlockedDateRange(date(2026, 1, 15), date(2026, 1, 18), "Reserved"),
+        BlockedDateRange(date(2026, 2, 1), date(2026, 2, 2), "Not available"),
+    ]
+    
+    parsed = parser.parse_ical(parser.generate_sample_ical(blocks))
+    
+    assert [(b.start_date, b.end_date, b.summary) for b in parsed] == [
+        (date(2026, 1, 15), date(2026, 1, 18), "Reserved"),
+        (date(2026, 2, 1), date(2026, 2, 2), "Not available"),
+    ]
+    assert parsed[0].uid == "block-0@channelmanager.test"
+
+
+def test_parse_handles_crlf_folding_and_datetimes():
+    """Test CRLF line endings, folded lines and DATE-TIME values."""
+    ical = (
+        "BEGIN:VCALENDAR\r\n"
+        "BEGIN:VEVENT\r\n"
+        "DTSTART:20260301T140000Z\r\n"
+        "DTEND;TZID=Europe/Paris:20260305T110000\r\n"
+        "SUMMARY:Airbnb (Not \r\n"
+        " available)\r\n"
+        "UID:abc@airbnb.com\r\n"
+        "END:VEVENT\r\n"
+        "BEGIN:VEVENT\r\n"
+        "SUMMARY:Missing dates are skipped\r\n"
+        "END:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    )
+    
+    parsed = ICalParser().parse_ical(ical)
+    
+    assert len(parsed) == 1
+    assert parsed[0].start_date == date(2026, 3, 1)
+    assert parsed[0].end_date == date(2026, 3, 5)
+    assert parsed[0].summary == "Airbnb (Not available)"
+    assert parsed[0].uid == "abc@airbnb.com"
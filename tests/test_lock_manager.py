@@ -69,8 +69,8 @@ async def test_multi_date_lock(lock_manager):
     ]
     
     # Acquire all locks
-    acquired = await lock_manager.acquire_multi_date_lock(room_type_id, dates)
-    assert acquired is True
+    token = await lock_manager.acquire_multi_date_lock(room_type_id, dates)
+    assert token is not None
     
     # Try to acquire one of the locked dates
     single_acquired = await lock_manager.acquire_lock(
@@ -79,7 +79,7 @@ async def test_multi_date_lock(lock_manager):
     assert single_acquired is False
     
     # Release all
-    await lock_manager.release_multi_date_lock(room_type_id, dates)
+    await lock_manager.release_multi_date_lock(room_type_id, dates, token)
     
     # Should be able to acquire again
     single_acquired_after = await lock_manager.acquire_lock(
@@ -106,7 +106,7 @@ async def test_multi_date_lock_rollback(lock_manager):
     
     # Try to acquire all dates (should fail on dates[1])
     acquired = await lock_manager.acquire_multi_date_lock(room_type_id, dates)
-    assert acquired is False
+    assert acquired is None
     
     # First date should have been rolled back
     first_available = await lock_manager.acquire_lock(room_type_id, dates[0])
@@ -117,6 +117,67 @@ async def test_multi_date_lock_rollback(lock_manager):
     await lock_manager.release_lock(room_type_id, dates[1])
 
 
+@pytest.mark.asyncio
+async def test_multi_date_lock_waits_for_holder(lock_manager):
+    """Test that a contended multi-date lock is acquired once the holder releases."""
+    room_type_id = 1
+    dates = [
+        date.today() + timedelta(days=40),
+        date.today() + timedelta(days=41),
+    ]
+    
+    holder = await lock_manager.acquire_multi_date_lock(room_type_id, dates)
+    assert holder is not None
+    
+    async def release_soon():
+        await asyncio.sleep(0.05)
+        await lock_manager.release_multi_date_lock(room_type_id, dates, holder)
+    
+    # The second acquire retries until the release lands
+    release_task = asyncio.create_task(release_soon())
+    token = await lock_manager.acquire_multi_date_lock(
+        room_type_id,
+        dates,
+        max_attempts=5,
+        retry_delay_ms=50,
+    )
+    await release_task
+    assert token is not None
+    
+    # Cleanup
+    await lock_manager.release_multi_date_lock(room_type_id, dates, token)
+
+
+@pytest.mark.asyncio
+async def test_stale_multi_date_release_keeps_new_owner(lock_manager):
+    """Test that a late release doesn't delete locks another owner now holds."""
+    room_type_id = 1
+    dates = [
+        date.today() + timedelta(days=30),
+        date.today() + timedelta(days=31),
+    ]
+    
+    token_a = await lock_manager.acquire_multi_date_lock(room_type_id, dates)
+    assert token_a is not None
+    
+    # A's locks expire (simulated by deleting them) and B takes the dates
+    for d in dates:
+        await lock_manager.release_lock(room_type_id, d)
+    token_b = await lock_manager.acquire_multi_date_lock(room_type_id, dates)
+    assert token_b is not None
+    
+    # A releases late: B's locks must survive
+    await lock_manager.release_multi_date_lock(room_type_id, dates, token_a)
+    assert await lock_manager.acquire_lock(room_type_id, dates[0]) is False
+    
+    # B's own release frees them
+    await lock_manager.release_multi_date_lock(room_type_id, dates, token_b)
+    assert await lock_manager.acquire_lock(room_type_id, dates[0]) is True
+    
+    # Cleanup
+    await lock_manager.release_lock(room_type_id, dates[0])
+
+
 @pytest.mark.asyncio
 async def test_lock_with_retry(lock_manager):
     """Test lock acquisition with retries."""
@@ -0,0 +1,32 @@
+"""Tests for property endpoint query loading."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from app.api.properties import _property_load_options
+from app.models import Property
+
+
+@pytest.mark.asyncio
+async def test_property_load_raises_on_unloaded_relationship(
+    db_session,
+    sample_property,
+):
+    """Test that property reads refuse implicit lazy loads (N+1)."""
+    # Drop cached instances so the loader options apply on reload
+    db_session.expunge_all()
+    
+    result = await db_session.execute(
+        select(Property)
+        .options(*_property_load_options())
+        .where(Property.id == sample_property.id)
+    )
+    property_obj = result.scalar_one()
+    
+    # Room types are eagerly loaded
+    assert len(property_obj.room_types) == 1
+    
+    # Anything else must raise instead of issuing a hidden query
+    with pytest.raises(InvalidRequestError):
+        property_obj.room_types[0].bookings
@@ -9,180 +9,187 @@ The test verifies that the Redis-based distributed lock prevents overbooking.
 """
 
 import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
+from typing import Optional
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 
 from app.models.inventory import InventoryLedger
 from app.models.booking import Booking
 from app.schemas.booking import BookingCreate
+from app.services.lock_manager import LockManager
 from app.services.sync_engine import SyncEngine
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RaceBookingResult:
+    """Outcome of one racing booking task."""
+    channel: str
+    booking_id: str
+    success: bool
+    message: str
+
+
+async def _race_booking(
+    session_factory,
+    lock_manager: LockManager,
+    booking_data: BookingCreate,
+    barrier: Optional[asyncio.Barrier] = None,
+) -> RaceBookingResult:
+    """Book through a session of its own, optionally starting on a barrier."""
+    if barrier is not None:
+        await barrier.wait()
+    async with session_factory() as session:
+        result = await SyncEngine(session, lock_manager).process_booking(
+            booking_data
+        )
+        await session.commit()
+    return RaceBookingResult(
+        channel=booking_data.channel_name,
+        booking_id=booking_data.ota_booking_id,
+        success=result.success,
+        message=result.message,
+    )
+
 
 @pytest.mark.asyncio
-async def test_concurrent_booking_last_room(
-    db_session,
-    sample_property,
-    last_room_inventory,
+@pytest.mark.parametrize(
+    "n_concurrent,available",
+    [
+        (2, 1),  # Booking.com and Airbnb racing for the last room
+        (3, 1),  # three channels racing for the last room
+        (2, 5),  # plenty of rooms: the lock must not reject valid bookings
+    ],
+)
+async def test_concurrent_booking(
+    n_concurrent,
+    available,
+    race_room_type_id,
+    async_session_factory,
+    readonly_session,
     lock_manager,
 ):
     """
-    CRITICAL TEST: Simulate two channels booking the last room simultaneously.
+    CRITICAL TEST: Simulate channels booking the same night simultaneously.
     
     Scenario:
-    - Room type has exactly 1 room available for tomorrow
-    - Booking.com and Airbnb both try to book at the same time
-    - Expected: Only ONE booking should succeed, the other should fail
+    - Room type has `available` rooms left for tomorrow
+    - `n_concurrent` channels all try to book at the same time
+    - Expected: exactly min(n_concurrent, available) bookings succeed and
+      the rest fail on availability or on the lock
+    
+    Tasks that lose the lock retry until the holder releases it, so with
+    spare rooms every booking goes through.
     
     This test verifies the Redis lock prevents race condition overbookings.
+    Every task books through its own session and connection on a
+    file-backed database, so the tasks genuinely interleave.
     """
-    room_type = sample_property.room_types[0]
-    check_in = last_room_inventory.date
+    room_type_id = race_room_type_id
+    check_in = date.today() + timedelta(days=1)
     check_out = check_in + timedelta(days=1)
     
-    # Track results
-    results = []
+    async with async_session_factory() as session:
+        inv_id = await session.scalar(
+            insert(InventoryLedger)
+            .values(
+                room_type_id=room_type_id,
+                date=check_in,
+                available_rooms=available,
+                base_price=Decimal("150.00"),
+            )
+            .returning(InventoryLedger.id)
+        )
+        await session.commit()
     
-    async def make_booking(channel: str, booking_id: str):
-        """Simulate a booking from specific channel."""
-        booking_data = BookingCreate(
-            room_type_id=room_type.id,
-            channel_name=channel,
-            ota_booking_id=booking_id,
+    # Hold every task until all of them are ready to book, so they hit the
+    # lock together instead of one finishing before the next starts
+    barrier = asyncio.Barrier(n_concurrent)
+    
+    bookings = [
+        BookingCreate(
+            room_type_id=room_type_id,
+            channel_name=f"ch_{i}",
+            ota_booking_id=f"ID_{i}",
             check_in=check_in,
             check_out=check_out,
-            guest_name=f"Guest from {channel}",
+            guest_name=f"Guest from ch_{i}",
             num_guests=2,
         )
-        
-        sync_engine = SyncEngine(db_session, lock_manager)
-        result = await sync_engine.process_booking(booking_data)
-        results.append({
-            "channel": channel,
-            "booking_id": booking_id,
-            "success": result.success,
-            "message": result.message,
-        })
-        return result
-    
-    # Execute both bookings concurrently
-    await asyncio.gather(
-        make_booking("booking_com", "BC_RACE_001"),
-        make_booking("airbnb", "AB_RACE_001"),
-        return_exceptions=True,
+        for i in range(n_concurrent)
+    ]
+    
+    # Execute all bookings concurrently; unexpected errors fail the test
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(_race_booking(
+                async_session_factory, lock_manager, booking_data, barrier
+            ))
+            for booking_data in bookings
+        ]
+    results = [task.result() for task in tasks]
+    
+    # Analyze results in one pass
+    outcomes = Counter(r.success for r in results)
+    expected = min(n_concurrent, available)
+    
+    # CRITICAL ASSERTION: never more bookings than rooms
+    assert outcomes[True] == expected, (
+        f"Expected exactly {expected} successful booking(s), "
+        f"got {outcomes[True]}. Results: {results}"
     )
-    
-    # Analyze results
-    successful = [r for r in results if r["success"]]
-    failed = [r for r in results if not r["success"]]
-    
-    # CRITICAL ASSERTION: Exactly one booking should succeed
-    assert len(successful) == 1, (
-        f"Expected exactly 1 successful booking, got {len(successful)}. "
-        f"Results: {results}"
+    assert outcomes[False] == n_concurrent - expected, (
+        f"Expected exactly {n_concurrent - expected} failed booking(s), "
+        f"got {outcomes[False]}. Results: {results}"
     )
     
-    # The other booking should have failed due to no availability
-    assert len(failed) == 1, (
-        f"Expected exactly 1 failed booking, got {len(failed)}. "
-        f"Results: {results}"
-    )
+    # Failed bookings should mention availability issue
+    for failed_result in results:
+        if failed_result.success:
+            continue
+        assert "availability" in failed_result.message.lower() or \
+               "lock" in failed_result.message.lower(), (
+            f"Expected availability or lock error, got: {failed_result.message}"
+        )
     
-    # Failed booking should mention availability issue
-    failed_result = failed[0]
-    assert "availability" in failed_result["message"].lower() or \
-           "lock" in failed_result["message"].lower(), (
-        f"Expected availability or lock error, got: {failed_result['message']}"
+    # Verify final inventory
+    rooms_left = await readonly_session.scalar(
+        select(InventoryLedger.available_rooms).where(InventoryLedger.id == inv_id)
     )
-    
-    # Verify final inventory is exactly 0
-    await db_session.refresh(last_room_inventory)
-    assert last_room_inventory.available_rooms == 0, (
-        f"Expected 0 available rooms, got {last_room_inventory.available_rooms}"
+    assert rooms_left == available - expected, (
+        f"Expected {available - expected} available rooms, got {rooms_left}"
     )
     
-    # Verify exactly one booking record exists
-    booking_result = await db_session.execute(
-        select(Booking).where(Booking.room_type_id == room_type.id)
+    # Verify one booking record per success
+    booking_count = await readonly_session.scalar(
+        select(func.count())
+        .select_from(Booking)
+        .where(Booking.room_type_id == room_type_id)
     )
-    bookings = booking_result.scalars().all()
-    assert len(bookings) == 1, (
-        f"Expected exactly 1 booking record, got {len(bookings)}"
+    assert booking_count == expected, (
+        f"Expected exactly {expected} booking record(s), got {booking_count}"
     )
     
-    print(f"\n✅ Race condition test PASSED!")
-    print(f"   Successful booking: {successful[0]['channel']} - {successful[0]['booking_id']}")
-    print(f"   Failed booking: {failed[0]['channel']} - {failed[0]['message']}")
-
-
-@pytest.mark.asyncio
-async def test_triple_concurrent_booking(
-    db_session,
-    sample_property,
-    lock_manager,
-):
-    """
-    Test three channels competing for the last room.
-    
-    Even with 3 concurrent requests, only 1 should succeed.
-    """
-    room_type = sample_property.room_types[0]
-    check_in = date.today() + timedelta(days=5)
-    check_out = check_in + timedelta(days=1)
-    
-    # Create inventory with exactly 1 room
-    inv = InventoryLedger(
-        room_type_id=room_type.id,
-        date=check_in,
-        available_rooms=1,
-        base_price=Decimal("200.00"),
+    logger.debug(
+        "Concurrent booking test passed (%d vs %d), winners: %s",
+        n_concurrent,
+        available,
+        [r.channel for r in results if r.success],
     )
-    db_session.add(inv)
-    await db_session.flush()
-    
-    results = []
-    
-    async def make_booking(channel: str, booking_id: str):
-        booking_data = BookingCreate(
-            room_type_id=room_type.id,
-            channel_name=channel,
-            ota_booking_id=booking_id,
-            check_in=check_in,
-            check_out=check_out,
-            guest_name=f"Guest from {channel}",
-        )
-        
-        sync_engine = SyncEngine(db_session, lock_manager)
-        result = await sync_engine.process_booking(booking_data)
-        results.append({"channel": channel, "success": result.success})
-        return result
-    
-    # Three concurrent bookings
-    await asyncio.gather(
-        make_booking("booking_com", "BC_TRIPLE_001"),
-        make_booking("airbnb", "AB_TRIPLE_001"),
-        make_booking("expedia", "EX_TRIPLE_001"),
-        return_exceptions=True,
-    )
-    
-    successful = [r for r in results if r["success"]]
-    
-    # Exactly one should succeed
-    assert len(successful) == 1, (
-        f"Expected exactly 1 successful booking from 3 attempts, got {len(successful)}"
-    )
-    
-    print(f"\n✅ Triple concurrent booking test PASSED!")
-    print(f"   Winner: {successful[0]['channel']}")
 
 
 @pytest.mark.asyncio
 async def test_sequential_bookings_fill_rooms(
     db_session,
     sample_property,
-    lock_manager,
+    sync_engine,
 ):
     """
     Test that sequential bookings correctly fill all rooms.
@@ -195,26 +202,32 @@ async def test_sequential_bookings_fill_rooms(
     check_out = check_in + timedelta(days=1)
     
     # Create inventory with 3 rooms
-    inv = InventoryLedger(
-        room_type_id=room_type.id,
-        date=check_in,
-        available_rooms=3,
-        base_price=Decimal("150.00"),
+    inv_id = await db_session.scalar(
+        insert(InventoryLedger)
+        .values(
+            room_type_id=room_type.id,
+            date=check_in,
+            available_rooms=3,
+            base_price=Decimal("150.00"),
+        )
+        .returning(InventoryLedger.id)
     )
-    db_session.add(inv)
-    await db_session.flush()
     
-    sync_engine = SyncEngine(db_session, lock_manager)
+    # Validate the shared fields once; each booking only swaps its IDs
+    base = BookingCreate(
+        room_type_id=room_type.id,
+        channel_name="booking_com",
+        ota_booking_id="BC_SEQ_000",
+        check_in=check_in,
+        check_out=check_out,
+        guest_name="Guest 1",
+    )
     
-    # Make 4 sequential bookings
+    # Make 4 sequential bookings. The lock fails fast on contention
+    # rather than waiting, so they must not overlap.
     for i in range(4):
-        booking_data = BookingCreate(
-            room_type_id=room_type.id,
-            channel_name="booking_com",
-            ota_booking_id=f"BC_SEQ_{i:03d}",
-            check_in=check_in,
-            check_out=check_out,
-            guest_name=f"Guest {i+1}",
+        booking_data = base.model_copy(
+            update={"ota_booking_id": f"BC_SEQ_{i:03d}", "guest_name": f"Guest {i+1}"}
         )
         
         result = await sync_engine.process_booking(booking_data)
@@ -228,62 +241,9 @@ async def test_sequential_bookings_fill_rooms(
             assert "availability" in result.message.lower()
     
     # Verify final state
-    await db_session.refresh(inv)
-    assert inv.available_rooms == 0
-    
-    print("\n✅ Sequential booking test PASSED - all rooms correctly filled")
-
-
-@pytest.mark.asyncio  
-async def test_no_race_condition_with_sufficient_inventory(
-    db_session,
-    sample_property,
-    lock_manager,
-):
-    """
-    Test that with sufficient inventory, multiple concurrent bookings succeed.
-    
-    This verifies the lock doesn't unnecessarily block valid bookings.
-    """
-    room_type = sample_property.room_types[0]
-    check_in = date.today() + timedelta(days=15)
-    check_out = check_in + timedelta(days=1)
-    
-    # Create inventory with 5 rooms (plenty for 2 bookings)
-    inv = InventoryLedger(
-        room_type_id=room_type.id,
-        date=check_in,
-        available_rooms=5,
-        base_price=Decimal("100.00"),
+    rooms_left = await db_session.scalar(
+        select(InventoryLedger.available_rooms).where(InventoryLedger.id == inv_id)
     )
-    db_session.add(inv)
-    await db_session.flush()
-    
-    async def make_booking(booking_id: str):
-        booking_data = BookingCreate(
-            room_type_id=room_type.id,
-            channel_name="booking_com",
-            ota_booking_id=booking_id,
-            check_in=check_in,
-            check_out=check_out,
-            guest_name="Test Guest",
-        )
-        
-        sync_engine = SyncEngine(db_session, lock_manager)
-        return await sync_engine.process_booking(booking_data)
-    
-    # Both bookings should succeed (though one will wait for lock)
-    result1, result2 = await asyncio.gather(
-        make_booking("BC_PLENTY_001"),
-        make_booking("BC_PLENTY_002"),
-    )
-    
-    # Both should succeed when there's plenty of inventory
-    # Note: Due to locking, they execute sequentially, but both should pass
-    successful_count = sum([result1.success, result2.success])
-    assert successful_count == 2, "Both bookings should succeed with sufficient inventory"
-    
-    await db_session.refresh(inv)
-    assert inv.available_rooms == 3  # Started with 5, booked 2
+    assert rooms_left == 0
     
-    print("\n✅ Sufficient inventory test PASSED - both bookings succeeded")
+    logger.debug("Sequential booking test passed - all rooms correctly filled")
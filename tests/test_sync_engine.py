@@ -4,12 +4,11 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 
 from app.models.inventory import InventoryLedger
 from app.models.booking import Booking
 from app.schemas.booking import BookingCreate
-from app.services.sync_engine import SyncEngine
 
 
 @pytest.mark.asyncio
@@ -17,22 +16,24 @@ async def test_booking_decrements_inventory(
     db_session,
     sample_property,
     sample_inventory,
-    lock_manager,
+    sync_engine,
 ):
     """Test that processing a booking decrements inventory."""
     room_type = sample_property.room_types[0]
     tomorrow = date.today() + timedelta(days=1)
     day_after = date.today() + timedelta(days=2)
     
-    # Get initial inventory count
-    result = await db_session.execute(
-        select(InventoryLedger).where(
+    # Rooms left across the booked night, read as a single aggregate
+    rooms_left = (
+        select(func.sum(InventoryLedger.available_rooms))
+        .where(
             InventoryLedger.room_type_id == room_type.id,
             InventoryLedger.date == tomorrow,
         )
     )
-    initial_inv = result.scalar_one()
-    initial_count = initial_inv.available_rooms
+    initial_count = await db_session.scalar(rooms_left)
+    # sample_inventory seeds 5 rooms; SUM is None if no row matched
+    assert initial_count == 5
     
     # Create booking
     booking_data = BookingCreate(
@@ -45,7 +46,6 @@ async def test_booking_decrements_inventory(
         num_guests=2,
     )
     
-    sync_engine = SyncEngine(db_session, lock_manager)
     result = await sync_engine.process_booking(booking_data)
     
     # Verify booking succeeded
@@ -54,15 +54,14 @@ async def test_booking_decrements_inventory(
     assert result.booking.ota_booking_id == "BK_TEST_001"
     
     # Verify inventory was decremented
-    await db_session.refresh(initial_inv)
-    assert initial_inv.available_rooms == initial_count - 1
+    assert await db_session.scalar(rooms_left) == initial_count - 1
 
 
 @pytest.mark.asyncio
 async def test_booking_fails_when_no_availability(
     db_session,
     sample_property,
-    lock_manager,
+    sync_engine,
 ):
     """Test that booking fails when no rooms available."""
     room_type = sample_property.room_types[0]
@@ -70,14 +69,14 @@ async def test_booking_fails_when_no_availability(
     day_after = date.today() + timedelta(days=2)
     
     # Create inventory with 0 rooms
-    inv = InventoryLedger(
-        room_type_id=room_type.id,
-        date=tomorrow,
-        available_rooms=0,  # No availability
-        base_price=Decimal("100.00"),
+    await db_session.execute(
+        insert(InventoryLedger).values(
+            room_type_id=room_type.id,
+            date=tomorrow,
+            available_rooms=0,  # No availability
+            base_price=Decimal("100.00"),
+        )
     )
-    db_session.add(inv)
-    await db_session.flush()
     
     booking_data = BookingCreate(
         room_type_id=room_type.id,
@@ -88,7 +87,6 @@ async def test_booking_fails_when_no_availability(
         guest_name="Test Guest",
     )
     
-    sync_engine = SyncEngine(db_session, lock_manager)
     result = await sync_engine.process_booking(booking_data)
     
     # Verify booking failed
@@ -97,7 +95,7 @@ async def test_booking_fails_when_no_availability(
 
 
 @pytest.mark.asyncio
-async def test_invalid_date_range(db_session, sample_property, lock_manager):
+async def test_invalid_date_range(db_session, sample_property, sync_engine):
     """Test that invalid date range is rejected."""
     room_type = sample_property.room_types[0]
     tomorrow = date.today() + timedelta(days=1)
@@ -112,7 +110,6 @@ async def test_invalid_date_range(db_session, sample_property, lock_manager):
         guest_name="Test Guest",
     )
     
-    sync_engine = SyncEngine(db_session, lock_manager)
     result = await sync_engine.process_booking(booking_data)
     
     assert result.success is False
@@ -124,7 +121,7 @@ async def test_multi_night_booking(
     db_session,
     sample_property,
     sample_inventory,
-    lock_manager,
+    sync_engine,
 ):
     """Test that multi-night booking decrements all nights."""
     room_type = sample_property.room_types[0]
@@ -140,20 +137,22 @@ async def test_multi_night_booking(
         guest_name="Multi Night Guest",
     )
     
-    sync_engine = SyncEngine(db_session, lock_manager)
     result = await sync_engine.process_booking(booking_data)
     
     assert result.success is True
     
-    # Verify all 3 nights were decremented
-    for i in range(3):
-        inv_date = check_in + timedelta(days=i)
-        inv_result = await db_session.execute(
-            select(InventoryLedger).where(
+    # Verify all 3 nights were decremented, read back in one IN query
+    nights = [check_in + timedelta(days=i) for i in range(3)]
+    rows = (
+        await db_session.execute(
+            select(InventoryLedger)
+            .where(
                 InventoryLedger.room_type_id == room_type.id,
-                InventoryLedger.date == inv_date,
+                InventoryLedger.date.in_(nights),
             )
+            .order_by(InventoryLedger.date)
         )
-        inv = inv_result.scalar_one()
-        # Initial was 5, should now be 4
-        assert inv.available_rooms == 4
+    ).scalars().all()
+    assert len(rows) == 3
+    # Initial was 5, should now be 4
+    assert all(inv.available_rooms == 4 for inv in rows)